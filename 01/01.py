@@ -1,11 +1,55 @@
 import argparse
+from typing import Iterable, Iterator
+import numpy as np
 from rich import print
 
 EXAMPLE_FILE_NAME = "example.txt"
 INPUT_FILE_NAME= "input.txt"
+VERBOSE = False
+STREAM_BLOCK_SIZE = 1 << 20
+
+ASCII_R, ASCII_L, ASCII_0, ASCII_9, ASCII_NEWLINE = b"RL09\n"
+
+def stream_rotations(input_filename:str, block_size:int=STREAM_BLOCK_SIZE) -> Iterator[tuple[int, int]]:
+    """
+    Yield (direction, amount) for each rotation, with direction 1 for R and -1
+    for L.  The file is read a block at a time into one reused buffer and
+    parsed byte by byte, so memory use doesn't depend on the size of the file
+    and no string is made per line.
+    """
+    buffer = bytearray(block_size)
+    view = memoryview(buffer)
+    direction = 0
+    amount = 0
+    with open(input_filename, "rb") as input_txt:
+        while (bytes_read := input_txt.readinto(buffer)) > 0:
+            for byte in view[:bytes_read]:
+                if byte == ASCII_R:
+                    direction = 1
+                elif byte == ASCII_L:
+                    direction = -1
+                elif ASCII_0 <= byte <= ASCII_9:
+                    amount = amount * 10 + byte - ASCII_0
+                elif byte == ASCII_NEWLINE and direction != 0:
+                    yield direction, amount
+                    direction = 0
+                    amount = 0
+
+    if direction != 0:
+        yield direction, amount
+
+def get_puzzle_input(use_example=False, as_deltas=False, as_stream=False, input_filename=None):
+    if input_filename is None:
+        input_filename = EXAMPLE_FILE_NAME if use_example else INPUT_FILE_NAME
+    if as_stream:
+        return stream_rotations(input_filename)
+
+    if as_deltas:
+        # R12 -> 12 and L12 -> -12, then let numpy parse the lot in one go
+        with open(input_filename, "rb") as input_txt:
+            rotations = input_txt.read().replace(b"R", b"").replace(b"L", b"-")
+        return np.fromstring(rotations, dtype=np.int64, sep="\n")
 
-def get_puzzle_input(use_example=False):
-    input_filename = EXAMPLE_FILE_NAME if use_example else INPUT_FILE_NAME
     puzzle_input = []
     with open(input_filename) as input_txt:
         for line in input_txt:
@@ -27,31 +71,88 @@ def solve_part_1(puzzle_input):
 
     return zero_count
 
+def turn_dial(position:int, direction:int, amount:int) -> tuple[int, int]:
+    """
+    Returns the new position and the number of times the dial pointed at zero
+    along the way
+    """
+    on_zero = position == 0
+    position += direction * amount
+    zero_count = 0
+    if position >= 100:
+        zero_count = position // 100
+    elif position <= 0:
+        zero_count = abs(position) // 100 + (0 if on_zero else 1)
+    return position % 100, zero_count
+
 def solve_part_2(puzzle_input):
     position = 50
     zero_count = 0
     for rotation in puzzle_input:
-        on_zero = position == 0
         direction = 1 if rotation[0] == "R" else -1
         amount = int(rotation[1:])
-        position += direction * amount
-        if position >= 100:
-            zero_count += position // 100
-        elif position <= 0:
-            zero_count += abs(position) // 100 + (0 if on_zero else 1)
-        position %= 100
+        position, zeros_passed = turn_dial(position, direction, amount)
+        zero_count += zeros_passed
 
     return zero_count
 
+def solve_stream(rotations:Iterable[tuple[int, int]]) -> tuple[int, int]:
+    """
+    Both parts in a single pass over (direction, amount) pairs
+    """
+    position = 50
+    zero_landings = 0
+    zero_count = 0
+    for direction, amount in rotations:
+        position, zeros_passed = turn_dial(position, direction, amount)
+        zero_count += zeros_passed
+        if position == 0:
+            zero_landings += 1
+
+    return zero_landings, zero_count
+
+def get_dial_positions(deltas:np.ndarray) -> np.ndarray:
+    """
+    Position of the dial before the first rotation and after each one, not
+    wrapped around, so that the number of laps is still in there
+    """
+    return np.concatenate(([50], 50 + np.cumsum(deltas)))
+
+def solve_part_1_numpy(deltas:np.ndarray):
+    positions = get_dial_positions(deltas)[1:]
+    return int(np.count_nonzero(positions % 100 == 0))
+
+def solve_part_2_numpy(deltas:np.ndarray):
+    positions = get_dial_positions(deltas)
+    before = positions[:-1]
+    after = positions[1:]
+    # Turning right passes zero at each multiple of 100 in (before, after], and
+    # turning left at each multiple of 100 in [after, before).  Shifting by one
+    # for the left turns is what stops a turn starting on zero from counting it.
+    right_turn_zeros = after // 100 - before // 100
+    left_turn_zeros = (before - 1) // 100 - (after - 1) // 100
+    return int(np.where(deltas >= 0, right_turn_zeros, left_turn_zeros).sum())
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--example", action="store_true")
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument("-v", "--verbose", action="store_true", help="print debug output while solving")
+    verbosity.add_argument("-q", "--quiet", action="store_true", help="print only the answers")
+    parser.add_argument("--numpy", action="store_true", help="simulate the dial with numpy cumsum")
+    parser.add_argument("--stream", action="store_true", help="stream the file and solve both parts in one pass")
     args = parser.parse_args()
+    VERBOSE = args.verbose
 
-    puzzle_input = get_puzzle_input(use_example=args.example)
+    puzzle_input = get_puzzle_input(use_example=args.example, as_deltas=args.numpy, as_stream=args.stream)
 
-    answer_1 = solve_part_1(puzzle_input)
-    print(f"Part 1: {answer_1}")
+    if args.stream:
+        answer_1, answer_2 = solve_stream(puzzle_input)
+    else:
+        part_1 = solve_part_1_numpy if args.numpy else solve_part_1
+        part_2 = solve_part_2_numpy if args.numpy else solve_part_2
+        answer_1 = part_1(puzzle_input)
+        answer_2 = part_2(puzzle_input)
 
-    answer_2 = solve_part_2(puzzle_input)
-    print(f"Part 2: {answer_2}")
+    print(answer_1 if args.quiet else f"Part 1: {answer_1}")
+    print(answer_2 if args.quiet else f"Part 2: {answer_2}")
@@ -1,38 +1,114 @@
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache, partial
+from itertools import combinations
+from math import prod
+from typing import Callable
+import numpy as np
 from rich import print
 
 EXAMPLE_FILE_NAME = "example.txt"
 INPUT_FILE_NAME= "input.txt"
+VERBOSE = False
+DEFAULT_CHUNK_SIZE = 100_000
+POWERS_OF_TEN = np.array([10 ** n for n in range(19)], dtype=np.int64)
 
 def normalize_range(r:str) -> tuple[int, int]:
     r_split = r.split('-')
     return [int(r_split[0]), int(r_split[1])]
 
 
-def get_puzzle_input(use_example=False):
-    input_filename = EXAMPLE_FILE_NAME if use_example else INPUT_FILE_NAME
+def get_puzzle_input(use_example=False, input_filename=None):
+    if input_filename is None:
+        input_filename = EXAMPLE_FILE_NAME if use_example else INPUT_FILE_NAME
     puzzle_input = []
     with open(input_filename) as input_file:
         text = input_file.read().strip()
         ranges = [normalize_range(r) for r in text.split(',')]
     return ranges
 
+def get_repunit_multiplier(digit_count:int, period:int) -> int:
+    """
+    The number that turns a period-digit block into that block repeated out to
+    digit_count digits, e.g. (6, 2) -> 10101, since 12 * 10101 = 121212
+    """
+    return (10 ** digit_count - 1) // (10 ** period - 1)
+
+def sum_repeats_in_range(low:int, high:int, digit_count:int, period:int) -> int:
+    """
+    Sum of the digit_count digit numbers in [low, high] that are one
+    period-digit block repeated.  Those are just the multiples of the repunit
+    multiplier whose block has no leading zero, so it's an arithmetic series.
+    """
+    multiplier = get_repunit_multiplier(digit_count, period)
+    smallest_block = max(10 ** (period - 1), -(-low // multiplier))
+    largest_block = min(10 ** period - 1, high // multiplier)
+    if smallest_block > largest_block:
+        return 0
+
+    return multiplier * (smallest_block + largest_block) * (largest_block - smallest_block + 1) // 2
+
+def get_prime_factors(n:int) -> list[int]:
+    prime_factors = []
+    factor = 2
+    while factor * factor <= n:
+        if n % factor == 0:
+            prime_factors.append(factor)
+            while n % factor == 0:
+                n //= factor
+        factor += 1
+    if n > 1:
+        prime_factors.append(n)
+    return prime_factors
+
+def sum_any_repeats_in_range(low:int, high:int, digit_count:int) -> int:
+    """
+    Sum of the digit_count digit numbers in [low, high] made of any block
+    repeated at least twice.  A number that repeats with some period also
+    repeats with every multiple of it that divides digit_count, so it's enough
+    to take the periods digit_count / q for each prime q.  Numbers repeating
+    with more than one of those get counted again, so fix that with
+    inclusion-exclusion: repeating with digit_count / q1 and digit_count / q2
+    is the same as repeating with digit_count / (q1 * q2).
+    """
+    total = 0
+    prime_factors = get_prime_factors(digit_count)
+    for subset_size in range(1, len(prime_factors) + 1):
+        sign = 1 if subset_size % 2 == 1 else -1
+        for primes in combinations(prime_factors, subset_size):
+            total += sign * sum_repeats_in_range(low, high, digit_count, digit_count // prod(primes))
+    return total
+
+def get_digit_counts(r:tuple[int, int]) -> range:
+    return range(len(str(r[0])), len(str(r[1])) + 1)
+
 def solve_part_1(ranges):
     total = 0
     for r in ranges:
-        for i in range(r[0], r[1]+1):
-            # could do this with ints, but don't want to think through edge cases
-            product_id = str(i)
+        for digit_count in get_digit_counts(r):
+            if digit_count % 2 == 0:
+                total += sum_repeats_in_range(r[0], r[1], digit_count, digit_count // 2)
 
-            if len(product_id) % 2 != 0:
-                continue
+    return total
 
-            midpoint = len(product_id) // 2
-            if product_id[:midpoint] == product_id[midpoint:]:
-                total += i
+def solve_part_2(ranges):
+    total = 0
+    for r in ranges:
+        for digit_count in get_digit_counts(r):
+            total += sum_any_repeats_in_range(r[0], r[1], digit_count)
 
     return total
 
+def is_doubled_sequence(product_id:int) -> bool:
+    # could do this with ints, but don't want to think through edge cases
+    product_id = str(product_id)
+
+    if len(product_id) % 2 != 0:
+        return False
+
+    midpoint = len(product_id) // 2
+    return product_id[:midpoint] == product_id[midpoint:]
+
 def any_repeating_sequence(product_id:int) -> bool:
     # could do this with ints, but don't want to think through edge cases
     product_id = str(product_id)
@@ -50,24 +126,109 @@ def any_repeating_sequence(product_id:int) -> bool:
 
     return False
 
-def solve_part_2(ranges):
-    total = 0
-    for r in ranges:
-        for i in range(r[0], r[1]+1):
-            if any_repeating_sequence(i):
-                total += i
-
-    return total
+def split_ranges(ranges, chunk_size:int) -> list[tuple[int, int]]:
+    """
+    Cut each range into nearly equal pieces of at most chunk_size ids
+    """
+    chunks = []
+    for low, high in ranges:
+        chunk_count = -(-(high - low + 1) // chunk_size)
+        for n in range(chunk_count):
+            chunk_low = low + (high - low + 1) * n // chunk_count
+            chunk_high = low + (high - low + 1) * (n + 1) // chunk_count - 1
+            chunks.append((chunk_low, chunk_high))
+    return chunks
+
+def sum_matching_ids(chunk:tuple[int, int], predicate:Callable[[int], bool]) -> int:
+    return sum(i for i in range(chunk[0], chunk[1] + 1) if predicate(i))
+
+@cache
+def get_period_multipliers(digit_count:int, repeats:int|None=None) -> list[int]:
+    """
+    Repunit multipliers for every period that tiles digit_count digits at
+    least twice, or exactly repeats times if that's given
+    """
+    return [
+        get_repunit_multiplier(digit_count, period)
+        for period in range(1, digit_count // 2 + 1)
+        if digit_count % period == 0 and (repeats is None or digit_count // period == repeats)
+    ]
+
+def repeating_sequence_mask(product_ids:np.ndarray, repeats:int|None=None) -> np.ndarray:
+    """
+    Vectorized any_repeating_sequence over an int64 array.  An L digit id is a
+    block repeated with period p exactly when it's a multiple of that period's
+    repunit multiplier, so group the ids by digit count and test all of a
+    group's periods with a modulo each.
+    """
+    digit_counts = np.searchsorted(POWERS_OF_TEN, product_ids, side="right")
+    mask = np.zeros(len(product_ids), dtype=bool)
+    for digit_count in np.unique(digit_counts).tolist():
+        in_group = digit_counts == digit_count
+        group_ids = product_ids[in_group]
+        group_mask = np.zeros(len(group_ids), dtype=bool)
+        for multiplier in get_period_multipliers(digit_count, repeats):
+            group_mask |= group_ids % multiplier == 0
+        mask[in_group] = group_mask
+    return mask
+
+def sum_repeating_ids_numpy(chunk:tuple[int, int], repeats:int|None=None) -> int:
+    product_ids = np.arange(chunk[0], chunk[1] + 1, dtype=np.int64)
+    # Back to python ints for the sum so a chunk of big ids can't overflow
+    return sum(product_ids[repeating_sequence_mask(product_ids, repeats)].tolist())
+
+def scan_ranges(ranges, chunk_sum:Callable[[tuple[int, int]], int], workers:int|None=None, chunk_size:int=DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Split the ranges into chunks and add up chunk_sum over all of them,
+    spreading the chunks over a pool of worker processes.  workers defaults to
+    one per core, and workers=1 skips the pool entirely.  chunk_sum has to be
+    picklable, so a module level function or a partial of one.
+    """
+    chunks = split_ranges(ranges, chunk_size)
+    if workers == 1:
+        return sum(map(chunk_sum, chunks))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(chunk_sum, chunks))
+
+def solve_part_1_brute_force(ranges, workers:int|None=None, chunk_size:int=DEFAULT_CHUNK_SIZE):
+    return scan_ranges(ranges, partial(sum_matching_ids, predicate=is_doubled_sequence), workers, chunk_size)
+
+def solve_part_2_brute_force(ranges, workers:int|None=None, chunk_size:int=DEFAULT_CHUNK_SIZE):
+    return scan_ranges(ranges, partial(sum_matching_ids, predicate=any_repeating_sequence), workers, chunk_size)
+
+def solve_part_1_numpy(ranges, workers:int|None=None, chunk_size:int=DEFAULT_CHUNK_SIZE):
+    return scan_ranges(ranges, partial(sum_repeating_ids_numpy, repeats=2), workers, chunk_size)
+
+def solve_part_2_numpy(ranges, workers:int|None=None, chunk_size:int=DEFAULT_CHUNK_SIZE):
+    return scan_ranges(ranges, sum_repeating_ids_numpy, workers, chunk_size)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--example", action="store_true")
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument("-v", "--verbose", action="store_true", help="print debug output while solving")
+    verbosity.add_argument("-q", "--quiet", action="store_true", help="print only the answers")
+    parser.add_argument("--brute-force", action="store_true", help="check every id in every range")
+    parser.add_argument("--numpy", action="store_true", help="check every id in every range, a chunk at a time with numpy")
+    parser.add_argument("--workers", type=int, default=None, help="processes for --brute-force/--numpy, default one per core")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="ids per --brute-force/--numpy work item")
     args = parser.parse_args()
+    VERBOSE = args.verbose
 
     puzzle_input = get_puzzle_input(use_example=args.example)
 
-    answer_1 = solve_part_1(puzzle_input)
-    print(f"Part 1: {answer_1}")
+    part_1 = solve_part_1
+    part_2 = solve_part_2
+    if args.numpy:
+        part_1 = partial(solve_part_1_numpy, workers=args.workers, chunk_size=args.chunk_size)
+        part_2 = partial(solve_part_2_numpy, workers=args.workers, chunk_size=args.chunk_size)
+    elif args.brute_force:
+        part_1 = partial(solve_part_1_brute_force, workers=args.workers, chunk_size=args.chunk_size)
+        part_2 = partial(solve_part_2_brute_force, workers=args.workers, chunk_size=args.chunk_size)
+
+    answer_1 = part_1(puzzle_input)
+    print(answer_1 if args.quiet else f"Part 1: {answer_1}")
 
-    answer_2 = solve_part_2(puzzle_input)
-    print(f"Part 2: {answer_2}")
+    answer_2 = part_2(puzzle_input)
+    print(answer_2 if args.quiet else f"Part 2: {answer_2}")
@@ -1,56 +1,90 @@
 import argparse
+from typing import Iterator
 from rich import print
 
 EXAMPLE_FILE_NAME = "example.txt"
 INPUT_FILE_NAME= "input.txt"
+VERBOSE = False
+
+def get_puzzle_input(use_example=False, as_bytes=False, input_filename=None):
+    if input_filename is None:
+        input_filename = EXAMPLE_FILE_NAME if use_example else INPUT_FILE_NAME
+    if as_bytes:
+        with open(input_filename, "rb") as input_txt:
+            return input_txt.read()
 
-def get_puzzle_input(use_example=False):
-    input_filename = EXAMPLE_FILE_NAME if use_example else INPUT_FILE_NAME
     puzzle_input = []
     with open(input_filename) as input_txt:
         for line in input_txt:
             puzzle_input.append(line.strip())
     return puzzle_input
 
-def solve_part_1(battery_banks):
-    total = 0
-    for bank in battery_banks:
-        first_digit = max(bank[:-1])
-        index_of_first_digit = bank.index(first_digit)
+def max_subsequence(bank:str|bytes, k:int) -> int:
+    """
+    The largest k digit number that can be made by picking digits out of the
+    bank in order.  Keep the picked digits on a stack: each new digit knocks
+    smaller digits off the top for as long as there are enough digits left in
+    the bank to still make k of them.  Every digit is pushed and popped at most
+    once, so this is linear in the length of the bank whatever k is.
+    """
+    digits = bank.encode("ascii") if isinstance(bank, str) else bank
+    if not 0 < k <= len(digits):
+        raise ValueError(f"Can't pick {k} digits from a bank of {len(digits)}")
 
-        second_digit = max(bank[index_of_first_digit+1:])
+    stack = bytearray()
+    droppable = len(digits) - k
+    for digit in digits:
+        while droppable > 0 and stack and stack[-1] < digit:
+            stack.pop()
+            droppable -= 1
+        stack.append(digit)
 
-        print(bank, first_digit, second_digit, first_digit+second_digit, int(first_digit+second_digit))
-        total += int(first_digit + second_digit)
+    return int(stack[:k])
 
-    return total
+def max_subsequences(buffer:bytes, k:int) -> Iterator[int]:
+    """
+    max_subsequence for every bank in a buffer of newline separated banks
+    """
+    return (max_subsequence(bank, k) for bank in buffer.split())
 
-def solve_part_2(battery_banks):
+def sum_max_subsequences(battery_banks, k:int) -> int:
     total = 0
     for bank in battery_banks:
-        print(bank)
-        digits = ""
-        remaining_bank = bank
-        for i in range(12):
-            next_digit = max(remaining_bank[:len(remaining_bank)-(11-len(digits))])
-            next_digit_index = remaining_bank.index(next_digit)
-            digits += next_digit
-            remaining_bank = remaining_bank[next_digit_index+1:]
-            print(i, next_digit, remaining_bank, 12 - i - 1)
-
-        assert len(digits) == 12
-        total += int(digits)
+        joltage = max_subsequence(bank, k)
+        if VERBOSE:
+            print(bank, joltage)
+        total += joltage
     return total
 
+def solve_part_1(battery_banks):
+    return sum_max_subsequences(battery_banks, 2)
+
+def solve_part_2(battery_banks):
+    return sum_max_subsequences(battery_banks, 12)
+
+def solve_part_1_batch(buffer:bytes):
+    return sum(max_subsequences(buffer, 2))
+
+def solve_part_2_batch(buffer:bytes):
+    return sum(max_subsequences(buffer, 12))
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--example", action="store_true")
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument("-v", "--verbose", action="store_true", help="print debug output while solving")
+    verbosity.add_argument("-q", "--quiet", action="store_true", help="print only the answers")
+    parser.add_argument("--batch", action="store_true", help="work on the raw bytes of the input")
     args = parser.parse_args()
+    VERBOSE = args.verbose
+
+    puzzle_input = get_puzzle_input(use_example=args.example, as_bytes=args.batch)
 
-    puzzle_input = get_puzzle_input(use_example=args.example)
+    part_1 = solve_part_1_batch if args.batch else solve_part_1
+    part_2 = solve_part_2_batch if args.batch else solve_part_2
 
-    answer_1 = solve_part_1(puzzle_input)
-    print(f"Part 1: {answer_1}")
+    answer_1 = part_1(puzzle_input)
+    print(answer_1 if args.quiet else f"Part 1: {answer_1}")
 
-    answer_2 = solve_part_2(puzzle_input)
-    print(f"Part 2: {answer_2}")
+    answer_2 = part_2(puzzle_input)
+    print(answer_2 if args.quiet else f"Part 2: {answer_2}")
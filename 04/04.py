@@ -1,22 +1,33 @@
 import argparse
+from collections import deque
+import numpy as np
 from rich import print
-from grid import Grid, Vector, grid_from_input_txt, ALL_DIRECTION_VECTORS, print_grid
+from grid import Grid, Vector, grid_from_input_txt, grid_to_array, ALL_DIRECTION_VECTORS, print_grid
 
 EXAMPLE_FILE_NAME = "example.txt"
 INPUT_FILE_NAME= "input.txt"
+VERBOSE = False
+PARSER_VERSION = 1
 
-def get_puzzle_input(use_example=False):
-    input_filename = EXAMPLE_FILE_NAME if use_example else INPUT_FILE_NAME
+def get_puzzle_input(use_example=False, dense=False, input_filename=None):
+    if input_filename is None:
+        input_filename = EXAMPLE_FILE_NAME if use_example else INPUT_FILE_NAME
     with open(input_filename) as input_txt:
-        return grid_from_input_txt(input_txt.read())
+        return grid_from_input_txt(input_txt.read(), dense=dense)
 
-def is_accessable(grid:Grid, roll_location:Vector) -> bool:
+def puzzle_input_to_arrays(grid:Grid) -> dict[str, np.ndarray]:
+    return {"cells": grid_to_array(grid)}
+
+def count_adjacent_rolls(grid:Grid, location:Vector) -> int:
     adjacent_roll_count = 0
     for direction in ALL_DIRECTION_VECTORS:
-        if grid[roll_location + direction] == "@":
+        if grid[location + direction] == "@":
             adjacent_roll_count += 1
 
-    return adjacent_roll_count < 4
+    return adjacent_roll_count
+
+def is_accessable(grid:Grid, roll_location:Vector) -> bool:
+    return count_adjacent_rolls(grid, roll_location) < 4
 
 def get_accessable_rolls(grid:Grid) -> set[Vector]:
     accessable_rolls = set()
@@ -30,29 +41,111 @@ def get_accessable_rolls(grid:Grid) -> set[Vector]:
 def solve_part_1(grid: Grid):
     return len(get_accessable_rolls(grid))
 
+def peel_rolls(grid:Grid) -> int:
+    """
+    Remove accessable rolls until none are left, marking them with "x".
+    Rather than rescanning the grid each round, keep a count of adjacent rolls
+    for each roll and a queue of rolls that have become accessable.  Removing a
+    roll only has to update its neighbors, so every roll is touched a constant
+    number of times.  Returns the number of rolls removed.
+    """
+    adjacent_roll_counts = {roll: count_adjacent_rolls(grid, roll) for roll in grid.find("@")}
+    removable = deque(roll for roll, count in adjacent_roll_counts.items() if count < 4)
+
+    removed_count = 0
+    while removable:
+        roll = removable.popleft()
+        grid[roll] = "x"
+        removed_count += 1
+
+        for direction in ALL_DIRECTION_VECTORS:
+            neighbor = roll + direction
+            if grid[neighbor] != "@":
+                continue
+
+            adjacent_roll_counts[neighbor] -= 1
+            # Only the step from 4 to 3 makes a roll accessable, so each roll
+            # is queued at most once
+            if adjacent_roll_counts[neighbor] == 3:
+                removable.append(neighbor)
+
+    return removed_count
+
 def solve_part_2(grid:Grid):
-    done = False
-    while done is False:
-        accessable_rolls = get_accessable_rolls(grid)
-        for roll in accessable_rolls:
-            grid[roll] = "x"
+    removed_count = peel_rolls(grid)
+
+    if VERBOSE:
+        print_grid(grid)
+
+    return removed_count
+
+def get_roll_mask(grid:Grid) -> np.ndarray:
+    """
+    Boolean array that is True wherever the grid has a roll
+    """
+    return grid_to_array(grid) == ord("@")
+
+def count_adjacent_rolls_numpy(roll_mask:np.ndarray) -> np.ndarray:
+    """
+    Count the rolls around every cell at once by adding up the mask shifted in
+    each of the 8 directions
+    """
+    padded = np.pad(roll_mask, 1).astype(np.uint8)
+    height, width = roll_mask.shape
+    counts = np.zeros(roll_mask.shape, dtype=np.uint8)
+    for direction in ALL_DIRECTION_VECTORS:
+        counts += padded[1 + direction.i:1 + direction.i + height, 1 + direction.j:1 + direction.j + width]
+    return counts
+
+def get_accessable_roll_mask(roll_mask:np.ndarray) -> np.ndarray:
+    return roll_mask & (count_adjacent_rolls_numpy(roll_mask) < 4)
 
-        if len(accessable_rolls) == 0:
-            done = True
+def count_accessable_rolls(roll_mask:np.ndarray) -> int:
+    return int(np.count_nonzero(get_accessable_roll_mask(roll_mask)))
 
-    print_grid(grid)
+def count_removable_rolls(roll_mask:np.ndarray) -> int:
+    removed_count = 0
+    while True:
+        accessable_rolls = get_accessable_roll_mask(roll_mask)
+        accessable_count = int(np.count_nonzero(accessable_rolls))
+        if accessable_count == 0:
+            break
 
-    return sum(1 for _ in grid.find("x"))
+        removed_count += accessable_count
+        roll_mask = roll_mask & ~accessable_rolls
+
+    return removed_count
+
+def solve_part_1_numpy(grid:Grid):
+    return count_accessable_rolls(get_roll_mask(grid))
+
+def solve_part_2_numpy(grid:Grid):
+    return count_removable_rolls(get_roll_mask(grid))
+
+def solve_part_1_arrays(arrays:dict[str, np.ndarray]):
+    return count_accessable_rolls(arrays["cells"] == ord("@"))
+
+def solve_part_2_arrays(arrays:dict[str, np.ndarray]):
+    return count_removable_rolls(arrays["cells"] == ord("@"))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--example", action="store_true")
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument("-v", "--verbose", action="store_true", help="print debug output while solving")
+    verbosity.add_argument("-q", "--quiet", action="store_true", help="print only the answers")
+    parser.add_argument("--dense", action="store_true", help="store the grid in a DenseGrid")
+    parser.add_argument("--numpy", action="store_true", help="count neighbors with numpy array shifts")
     args = parser.parse_args()
+    VERBOSE = args.verbose
+
+    puzzle_input = get_puzzle_input(use_example=args.example, dense=args.dense)
 
-    puzzle_input = get_puzzle_input(use_example=args.example)
+    part_1 = solve_part_1_numpy if args.numpy else solve_part_1
+    part_2 = solve_part_2_numpy if args.numpy else solve_part_2
 
-    answer_1 = solve_part_1(puzzle_input)
-    print(f"Part 1: {answer_1}")
+    answer_1 = part_1(puzzle_input)
+    print(answer_1 if args.quiet else f"Part 1: {answer_1}")
 
-    answer_2 = solve_part_2(puzzle_input)
-    print(f"Part 2: {answer_2}")
+    answer_2 = part_2(puzzle_input)
+    print(answer_2 if args.quiet else f"Part 2: {answer_2}")
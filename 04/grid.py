@@ -4,10 +4,12 @@ can get through 2025 without making any changes.
 """
 
 from collections import namedtuple
-from functools import cache
+from functools import lru_cache
 import math
 from typing import Iterable
 
+import numpy as np
+
 
 class Vector(namedtuple("Vector", ["i", "j"])):
     """
@@ -21,8 +23,9 @@ class Vector(namedtuple("Vector", ["i", "j"])):
         return a.i * b.i + a.j * b.j
 
     def __add__(self, other: "Vector") -> "Vector":
-        # Could almost certainly optimize this
-        return get_vector(self.i + other.i, self.j + other.j)
+        # This is the hot one when walking a grid, so build the tuple directly
+        # rather than going through the namedtuple constructor or get_vector
+        return tuple.__new__(Vector, (self.i + other.i, self.j + other.j))
 
     def __sub__(self, other: "Vector") -> "Vector":
         return get_vector(self.i - other.i, self.j - other.j)
@@ -47,7 +50,9 @@ class Vector(namedtuple("Vector", ["i", "j"])):
         return get_vector(self.i / abs(self), self.j / abs(self))
 
 
-@cache
+# Bounded, since a big grid touches millions of locations and an unbounded
+# cache would keep a Vector for every one of them alive for good
+@lru_cache(maxsize=1 << 16)
 def get_vector(i: int, j: int) -> Vector:
     return Vector(i, j)
 
@@ -113,16 +118,101 @@ class Grid:
         return found_locations[0]
 
 
-def grid_from_input_txt(ascii_grid: str, out_of_bounds=".") -> Grid:
+ASCII_CHARACTERS = [chr(code) for code in range(256)]
+
+
+class DenseGrid(Grid):
     """
-    Import an ascii grid into a Grid object
+    2D Grid backed by one contiguous bytearray, stored row-major.  Cells are
+    single ascii characters.  Same interface as Grid, but a fixed size: reads
+    outside of it give out_of_bounds and writes outside of it are an error.
+
+    Reads go through a memoryview of each row, so indexing past the end of a
+    row or the last row raises instead of needing bounds checks on every
+    lookup, and a table lookup stands in for chr().  The views share the
+    bytearray, so writes are a single byte either way.
     """
+
+    def __init__(self, height: int, width: int, out_of_bounds=".", fill=".", cells=None):
+        self.height = height
+        self.width = width
+        if cells is None:
+            self.cells = bytearray(fill.encode("ascii") * (height * width))
+        else:
+            self.cells = bytearray(cells)
+            if len(self.cells) != height * width:
+                raise ValueError(f"{len(self.cells)} cells don't make a {height}x{width} grid")
+        cells_view = memoryview(self.cells)
+        self.rows = [cells_view[i * width:(i + 1) * width] for i in range(height)]
+        self.out_of_bounds = out_of_bounds
+
+    def __getitem__(self, key: Vector):
+        i, j = key
+        if i >= 0 and j >= 0:
+            try:
+                return ASCII_CHARACTERS[self.rows[i][j]]
+            except IndexError:
+                pass
+        return self.out_of_bounds
+
+    def __setitem__(self, key: Vector, value):
+        i, j = key
+        if not (0 <= i < self.height and 0 <= j < self.width):
+            raise IndexError(f"{key} is outside of a {self.height}x{self.width} grid")
+        self.cells[i * self.width + j] = ord(value)
+
+    def all_locations(self) -> Iterable[Vector]:
+        return (Vector(i, j) for i in range(self.height) for j in range(self.width))
+
+    def find(self, value) -> Iterable[Vector]:
+        # bytearray.find does the scanning in C, so we only touch the matches
+        target = ord(value)
+        index = self.cells.find(target)
+        while index != -1:
+            yield tuple.__new__(Vector, divmod(index, self.width))
+            index = self.cells.find(target, index + 1)
+
+
+def grid_from_input_txt(ascii_grid: str, out_of_bounds=".", dense=False) -> Grid:
+    """
+    Import an ascii grid into a Grid object, or a DenseGrid if dense is set
+    """
+    if dense:
+        return dense_grid_from_input_txt(ascii_grid, out_of_bounds)
+
     grid = Grid(out_of_bounds)
     for i, row in enumerate(ascii_grid.split("\n")):
         for j, cell in enumerate(row):
             grid.grid[get_vector(i, j)] = cell
     return grid
 
+def dense_grid_from_input_txt(ascii_grid: str, out_of_bounds=".") -> DenseGrid:
+    """
+    Import a rectangular ascii grid into a DenseGrid object
+    """
+    rows = ascii_grid.rstrip("\n").split("\n")
+    width = len(rows[0])
+    if any(len(row) != width for row in rows):
+        raise ValueError("DenseGrid needs every row to be the same length")
+
+    return DenseGrid(len(rows), width, out_of_bounds, cells="".join(rows).encode("ascii"))
+
+def grid_to_array(grid: Grid) -> np.ndarray:
+    """
+    The cells of a grid as a (height, width) uint8 array of ascii codes.  Any
+    cells missing from a ragged Grid are filled in with out_of_bounds, which
+    reads the same.
+    """
+    if isinstance(grid, DenseGrid):
+        return np.frombuffer(grid.cells, dtype=np.uint8).reshape(grid.height, grid.width)
+
+    height = max(location.i for location in grid.all_locations()) + 1
+    width = max(location.j for location in grid.all_locations()) + 1
+    cells = np.full((height, width), ord(grid.out_of_bounds), dtype=np.uint8)
+    for (i, j), cell in grid.grid.items():
+        cells[i, j] = ord(cell)
+    return cells
+
 def print_grid(grid:Grid):
     """
     Print a grid.  This is a little more complicated than it could be because
@@ -1,11 +1,28 @@
 import argparse
+import numpy as np
 from rich import print
+from intervals import IntervalIndex, merge_and_count
 
 EXAMPLE_FILE_NAME = "example.txt"
 INPUT_FILE_NAME= "input.txt"
+VERBOSE = False
+
+def parse_range(line:str) -> tuple[int, int]:
+    r = tuple(map(int, line.split("-")))
+    assert r[0] <= r[1]
+    return r
+
+def get_puzzle_input(use_example=False, items_as_array=False, input_filename=None):
+    if input_filename is None:
+        input_filename = EXAMPLE_FILE_NAME if use_example else INPUT_FILE_NAME
+    if items_as_array:
+        # Hand the whole item section to numpy rather than going through a
+        # python int per line
+        with open(input_filename, "rb") as input_txt:
+            range_section, _, item_section = input_txt.read().partition(b"\n\n")
+        ranges = [parse_range(line.decode()) for line in range_section.split()]
+        return ranges, np.fromstring(item_section, dtype=np.int64, sep="\n")
 
-def get_puzzle_input(use_example=False):
-    input_filename = EXAMPLE_FILE_NAME if use_example else INPUT_FILE_NAME
     puzzle_input = []
     with open(input_filename) as input_txt:
         ranges = []
@@ -13,57 +30,51 @@ def get_puzzle_input(use_example=False):
         for line in input_txt:
             line = line.strip()
             if "-" in line:
-                r = tuple(map(int, line.split("-")))
-                assert r[0] <= r[1]
-                ranges.append(r)
+                ranges.append(parse_range(line))
             elif len(line) > 0:
                 items.append(int(line))
     return ranges, items
 
 def solve_part_1(ranges, items):
-    fresh_items = 0
-    for item in items:
-        for range in ranges:
-            if item >= range[0] and item <= range[1]:
-                fresh_items += 1
-                break
-    return fresh_items
-
-def ranges_intersect(a:tuple[int,int], b:tuple[int, int]) -> bool:
-    return a[0] <= b[1] and a[1] >= b[0]
+    return IntervalIndex(ranges).count_contained(items)
 
-def combine_ranges(a:tuple[int,int], b:tuple[int, int]) -> tuple[int,int]:
-    return (min(a[0], b[0]), max(a[1], b[1]))
+def count_contained_numpy(index:IntervalIndex, items:np.ndarray) -> int:
+    """
+    Classify every item at once: searchsorted finds the last merged interval
+    starting at or before each item, and then it's in the index if it's no
+    further along than that interval's end.
+    """
+    if len(index.starts) == 0:
+        return 0
 
-def solve_part_2(ranges, _):
-    uncleared_ranges = set(ranges)
-    cleared_ranges = []
-    while len(uncleared_ranges) > 0:
-        range_to_check = uncleared_ranges.pop()
-
-        found_intersection = False
-        for other_range in list(uncleared_ranges):
-            if ranges_intersect(range_to_check, other_range):
-                found_intersection = True
-                range_to_check = combine_ranges(range_to_check, other_range)
-                uncleared_ranges.remove(other_range)
+    starts = np.array(index.starts, dtype=np.int64)
+    ends = np.array(index.ends, dtype=np.int64)
+    position = np.searchsorted(starts, items, side="right") - 1
+    contained = (position >= 0) & (items <= ends[position])
+    return int(np.count_nonzero(contained))
 
-        if found_intersection:
-            uncleared_ranges.add(range_to_check)
-        else:
-            cleared_ranges.append(range_to_check)
+def solve_part_1_numpy(ranges, items):
+    return count_contained_numpy(IntervalIndex(ranges), np.asarray(items, dtype=np.int64))
 
-    return sum(r[1] - r[0] + 1 for r in cleared_ranges)
+def solve_part_2(ranges, _):
+    _, covered_count = merge_and_count(ranges)
+    return covered_count
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--example", action="store_true")
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument("-v", "--verbose", action="store_true", help="print debug output while solving")
+    verbosity.add_argument("-q", "--quiet", action="store_true", help="print only the answers")
+    parser.add_argument("--numpy", action="store_true", help="load the items into an array and check them all at once")
     args = parser.parse_args()
+    VERBOSE = args.verbose
 
-    ranges, items = get_puzzle_input(use_example=args.example)
+    ranges, items = get_puzzle_input(use_example=args.example, items_as_array=args.numpy)
 
-    answer_1 = solve_part_1(ranges, items)
-    print(f"Part 1: {answer_1}")
+    part_1 = solve_part_1_numpy if args.numpy else solve_part_1
+    answer_1 = part_1(ranges, items)
+    print(answer_1 if args.quiet else f"Part 1: {answer_1}")
 
     answer_2 = solve_part_2(ranges, items)
-    print(f"Part 2: {answer_2}")
+    print(answer_2 if args.quiet else f"Part 2: {answer_2}")
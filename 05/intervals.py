@@ -0,0 +1,98 @@
+"""
+Sorted, merged sets of inclusive integer ranges, for asking which numbers fall
+inside any of them.
+"""
+
+from bisect import bisect_right
+import heapq
+from typing import Iterable, Iterator
+
+Interval = tuple[int, int]
+
+
+def merge_sorted_intervals(intervals: Iterable[Interval]) -> Iterator[Interval]:
+    """
+    Merge intervals that are already sorted by their start, yielding each
+    merged interval as soon as it can't grow any more.  Only one interval is
+    held at a time, so the input can be streamed from anywhere.
+    """
+    current = None
+    for low, high in intervals:
+        if current is None:
+            current = (low, high)
+        elif low < current[0]:
+            raise ValueError("Intervals must be sorted by their start")
+        elif low <= current[1] + 1:
+            current = (current[0], max(current[1], high))
+        else:
+            yield current
+            current = (low, high)
+
+    if current is not None:
+        yield current
+
+
+def merge_interval_chunks(chunks: Iterable[Iterable[Interval]]) -> Iterator[Interval]:
+    """
+    Merge intervals arriving as several runs that are each sorted on their own
+    """
+    return merge_sorted_intervals(heapq.merge(*chunks))
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> list[Interval]:
+    """
+    Sort the intervals and merge any that overlap or touch
+    """
+    return list(merge_sorted_intervals(sorted(intervals)))
+
+
+def merge_and_count(intervals: Iterable[Interval]) -> tuple[list[Interval], int]:
+    """
+    Merge the intervals and count the numbers they cover in the same sweep
+    """
+    merged = []
+    covered_count = 0
+    for low, high in merge_sorted_intervals(sorted(intervals)):
+        merged.append((low, high))
+        covered_count += high - low + 1
+    return merged, covered_count
+
+
+def count_covered(sorted_intervals: Iterable[Interval]) -> int:
+    """
+    Count the numbers covered by intervals that are already sorted by start,
+    without holding more than one of them at a time
+    """
+    return sum(high - low + 1 for low, high in merge_sorted_intervals(sorted_intervals))
+
+
+class IntervalIndex:
+    """
+    Membership index over a set of inclusive ranges.  The ranges are merged
+    once up front, so after that a lookup is a single bisect.
+    """
+
+    def __init__(self, intervals: Iterable[Interval]):
+        merged = merge_intervals(intervals)
+        self.starts = [low for low, _ in merged]
+        self.ends = [high for _, high in merged]
+
+    def __contains__(self, value: int) -> bool:
+        index = bisect_right(self.starts, value) - 1
+        return index >= 0 and value <= self.ends[index]
+
+    def count_contained(self, values: Iterable[int]) -> int:
+        """
+        Count how many of the values fall in the index.  Sorting the values
+        first lets one sweep walk the values and the intervals together.
+        """
+        count = 0
+        index = 0
+        for value in sorted(values):
+            while index < len(self.ends) and self.ends[index] < value:
+                index += 1
+            if index == len(self.ends):
+                break
+            if self.starts[index] <= value:
+                count += 1
+        return count
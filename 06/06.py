@@ -1,92 +1,162 @@
 import argparse
+from math import prod
+from typing import Iterator
+import numpy as np
 from rich import print
 
 EXAMPLE_FILE_NAME = "example.txt"
 INPUT_FILE_NAME= "input.txt"
+VERBOSE = False
+SPACE = ord(" ")
+PLUS = ord("+")
+MAX_INT64_DIGITS = 18
+
+def get_puzzle_input(use_example=False, input_filename=None):
+    if input_filename is None:
+        input_filename = EXAMPLE_FILE_NAME if use_example else INPUT_FILE_NAME
+    with open(input_filename, "rb") as input_txt:
+        return input_txt.read()
+
+def get_row_offsets(worksheet:bytes) -> list[tuple[int, int]]:
+    """
+    (start, end) offsets of each non-empty line in the worksheet, so cells can
+    be read straight out of the buffer without splitting it up
+    """
+    row_offsets = []
+    start = 0
+    while start < len(worksheet):
+        end = worksheet.find(b"\n", start)
+        if end == -1:
+            end = len(worksheet)
+        if end > start:
+            row_offsets.append((start, end))
+        start = end + 1
+    return row_offsets
+
+def iter_problems(worksheet:bytes, by_column=False) -> Iterator[tuple[list[int], str]]:
+    """
+    Yield (operands, operator) for each problem on the worksheet, left to
+    right.  Problems are runs of columns with something in them, and the
+    operator sits in the last row.  Normally each row holds an operand; with
+    by_column, each column holds one instead, read top to bottom, and the
+    columns are taken right to left.
+
+    Columns are walked by offset into the raw buffer, so nothing bigger than
+    one problem is ever built.
+    """
+    row_offsets = get_row_offsets(worksheet)
+    operand_rows = row_offsets[:-1]
+    operator_start, operator_end = row_offsets[-1]
+    width = max(end - start for start, end in row_offsets)
+
+    def cell(row:tuple[int, int], column:int) -> int:
+        start, end = row
+        return worksheet[start + column] if start + column < end else SPACE
+
+    column = 0
+    while column < width:
+        if all(cell(row, column) == SPACE for row in row_offsets):
+            column += 1
+            continue
 
-def get_puzzle_input(use_example=False):
-    input_filename = EXAMPLE_FILE_NAME if use_example else INPUT_FILE_NAME
-    puzzle_input = []
-    longest_line_len = 0
-    with open(input_filename) as input_txt:
-        for line in input_txt:
-            line = line.strip()
-            if len(line) > longest_line_len:
-                longest_line_len = len(line)
-            puzzle_input.append(line)
-
-    for i, line in enumerate(puzzle_input):
-        puzzle_input[i] = line + (longest_line_len - len(line)) * " "
-
-    assert all(len(line) == len(puzzle_input[0]) for line in puzzle_input)
-    return puzzle_input
-
-def mul(*numbers):
-    total = 1
-    for n in numbers:
-        total *= int(n)
-    return total
+        problem_start = column
+        while column < width and not all(cell(row, column) == SPACE for row in row_offsets):
+            column += 1
+        problem_end = column
 
-def sum2(*numbers):
-    total = 0
-    for n in numbers:
-        total += int(n)
-    return total
+        operator = worksheet[operator_start + problem_start:min(operator_start + problem_end, operator_end)].strip().decode()
 
-def solve_part_1(puzzle_input):
-    lines = []
-    for line in puzzle_input:
-        lines.append(line.split())
+        operands = []
+        if by_column:
+            for operand_column in reversed(range(problem_start, problem_end)):
+                digits = [cell(row, operand_column) for row in operand_rows]
+                if any(digit != SPACE for digit in digits):
+                    operands.append(int(bytes(digits)))
+        else:
+            for start, end in operand_rows:
+                number = worksheet[start + problem_start:min(start + problem_end, end)]
+                if number.strip():
+                    operands.append(int(number))
 
-    columns = list(zip(*lines))
+        yield operands, operator
 
+def apply_operator(operands:list[int], operator:str) -> int:
+    return sum(operands) if operator == "+" else prod(operands)
+
+def solve_worksheet(worksheet:bytes, by_column=False) -> int:
     total = 0
-    for column in columns:
-        operation = sum2 if column[4] == "+" else mul
-        result = operation(*column[:4])
+    for operands, operator in iter_problems(worksheet, by_column):
+        result = apply_operator(operands, operator)
         total += result
-        print(column, result, total)
+        if VERBOSE:
+            print(operands, operator, result, total)
 
     return total
 
-def solve_part_2(puzzle_input):
-    columns = list(zip(*puzzle_input))
-
-    total = 0
-    unused_words = []
-    for column in reversed(columns):
-        word = "".join(column).strip()
-        print(word)
-
-        if len(word) == 0:
-            continue
-
-        operand = None
-        if word.endswith("+"):
-            operand = sum2
-        elif word.endswith("*"):
-            operand = mul
-
-        if operand is not None:
-            word = word[:-1]
-
-        unused_words.append(word)
-
-        if operand is not None:
-            total += operand(*unused_words)
-            unused_words = []
-
-    return total
+def solve_part_1(worksheet:bytes):
+    return solve_worksheet(worksheet)
+
+def solve_part_2(worksheet:bytes):
+    return solve_worksheet(worksheet, by_column=True)
+
+def get_operand_matrix(worksheet:bytes) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The operand rows as a (rows, problems) matrix, and the operator byte for
+    each problem.  The matrix is int64 unless the widest problem leaves room
+    for numbers too big for it, in which case it holds python ints instead.
+    """
+    row_offsets = get_row_offsets(worksheet)
+    operator_start, operator_end = row_offsets[-1]
+    operator_row = np.frombuffer(worksheet, dtype=np.uint8, count=operator_end - operator_start, offset=operator_start)
+    operator_columns = np.flatnonzero(operator_row != SPACE)
+    operators = operator_row[operator_columns]
+
+    # Each problem runs from its operator up to the blank column before the
+    # next one, which caps how many digits its numbers can have
+    width = max(end - start for start, end in row_offsets)
+    widest_problem = int(np.diff(operator_columns, append=width + 1).max()) - 1
+
+    operand_rows = row_offsets[:-1]
+    if widest_problem <= MAX_INT64_DIGITS:
+        operands = np.array([np.fromstring(worksheet[start:end], dtype=np.int64, sep=" ") for start, end in operand_rows])
+    else:
+        operands = np.array([[int(n) for n in worksheet[start:end].split()] for start, end in operand_rows], dtype=object)
+
+    return operands.reshape(len(operand_rows), len(operators)), operators
+
+def reduce_operand_matrix(operands:np.ndarray, operators:np.ndarray) -> int:
+    """
+    Sum the + columns and multiply the * columns, a whole group at a time.  If
+    a rough float64 bound says the products or the grand total could overflow
+    int64, fall back to python ints for exact answers.
+    """
+    is_sum = operators == PLUS
+    if operands.dtype != object:
+        magnitude = np.abs(operands).astype(np.float64)
+        bound = magnitude[:, is_sum].sum() + magnitude[:, ~is_sum].prod(axis=0).sum()
+        if bound >= 2 ** 62:
+            operands = operands.astype(object)
+
+    return int(operands[:, is_sum].sum()) + int(operands[:, ~is_sum].prod(axis=0).sum())
+
+def solve_part_1_numpy(worksheet:bytes):
+    return reduce_operand_matrix(*get_operand_matrix(worksheet))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--example", action="store_true")
+    parser.add_argument("--numpy", action="store_true", help="reduce part 1 as a numpy matrix")
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument("-v", "--verbose", action="store_true", help="print debug output while solving")
+    verbosity.add_argument("-q", "--quiet", action="store_true", help="print only the answers")
     args = parser.parse_args()
+    VERBOSE = args.verbose
 
     puzzle_input = get_puzzle_input(use_example=args.example)
 
-    answer_1 = solve_part_1(puzzle_input)
-    print(f"Part 1: {answer_1}")
+    part_1 = solve_part_1_numpy if args.numpy else solve_part_1
+    answer_1 = part_1(puzzle_input)
+    print(answer_1 if args.quiet else f"Part 1: {answer_1}")
 
     answer_2 = solve_part_2(puzzle_input)
-    print(f"Part 2: {answer_2}")
+    print(answer_2 if args.quiet else f"Part 2: {answer_2}")
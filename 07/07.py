@@ -1,70 +1,143 @@
 import argparse
-from functools import cache
+from bisect import bisect_right
+from collections import defaultdict
+from heapq import heappop, heappush
+import numpy as np
 from rich import print
-from grid import grid_from_input_txt, NORTH, SOUTH, EAST, WEST, Grid, Vector, print_grid
+from grid import grid_from_input_txt, grid_to_array, get_vector, EAST, WEST, Grid, Vector
 
 EXAMPLE_FILE_NAME = "example.txt"
 INPUT_FILE_NAME= "input.txt"
+VERBOSE = False
+PARSER_VERSION = 1
 
-def get_puzzle_input(use_example=False):
-    input_filename = EXAMPLE_FILE_NAME if use_example else INPUT_FILE_NAME
+def get_puzzle_input(use_example=False, dense=False, input_filename=None):
+    if input_filename is None:
+        input_filename = EXAMPLE_FILE_NAME if use_example else INPUT_FILE_NAME
     puzzle_input = []
     with open(input_filename) as input_txt:
-        puzzle_input = grid_from_input_txt(input_txt.read(), out_of_bounds="X")
+        puzzle_input = grid_from_input_txt(input_txt.read(), out_of_bounds="X", dense=dense)
     return puzzle_input
 
-def traverse_beam(grid:Grid, location:Vector):
-    next_path = location + SOUTH
-
-    if grid[next_path] == ".":
-        grid[next_path] = "|"
-        traverse_beam(grid, next_path)
-    elif grid[next_path] == "^":
-        traverse_beam(grid, next_path + WEST)
-        traverse_beam(grid, next_path + EAST)
-    elif grid[next_path] in "|X":
-        pass
-    else:
-        raise Exception("Unexpected grid state")
+def puzzle_input_to_arrays(grid:Grid) -> dict[str, np.ndarray]:
+    return {"cells": grid_to_array(grid)}
+
+def build_splitter_index(grid:Grid) -> dict[int, list[int]]:
+    """
+    Map each column to the sorted rows of the splitters in it
+    """
+    splitter_rows = defaultdict(list)
+    for splitter in grid.find("^"):
+        splitter_rows[splitter.j].append(splitter.i)
+
+    for rows in splitter_rows.values():
+        rows.sort()
+    return dict(splitter_rows)
+
+def build_splitter_index_numpy(cells:np.ndarray) -> dict[int, list[int]]:
+    """
+    Same as build_splitter_index, from a (height, width) array of ascii codes.
+    Searching the transpose turns up the splitters column by column, and in
+    row order within each column.
+    """
+    splitter_rows = defaultdict(list)
+    columns, rows = np.nonzero(cells.T == ord("^"))
+    for column, row in zip(columns.tolist(), rows.tolist()):
+        splitter_rows[column].append(row)
+    return dict(splitter_rows)
+
+def next_splitter_row(splitter_rows:dict[int, list[int]], location:Vector) -> int | None:
+    """
+    Row of the first splitter below location, or None if the beam leaves the
+    manifold
+    """
+    rows = splitter_rows.get(location.j)
+    if rows is None:
+        return None
+
+    index = bisect_right(rows, location.i)
+    return rows[index] if index < len(rows) else None
+
+def sweep_beams(grid:Grid) -> tuple[int, int]:
+    """
+    Returns the number of splitters hit and the total number of timelines,
+    without touching the grid.
+    """
+    return sweep_splitter_index(grid.find_one("S"), build_splitter_index(grid))
+
+def sweep_beams_numpy(cells:np.ndarray) -> tuple[int, int]:
+    """
+    Same as sweep_beams, from a (height, width) array of ascii codes
+    """
+    starts = np.argwhere(cells == ord("S"))
+    if len(starts) != 1:
+        raise Exception("Expected to find one location")
+    return sweep_splitter_index(get_vector(*starts[0].tolist()), build_splitter_index_numpy(cells))
+
+def sweep_splitter_index(start_location:Vector, splitter_rows:dict[int, list[int]]) -> tuple[int, int]:
+    """
+    Send the beams down the manifold, jumping each one straight to the next
+    splitter below it.  Splitters are handled in row order so that every
+    timeline arriving at a splitter has been counted before it splits.
+    """
+    split_count = 0
+    finished_timelines = 0
+    # A column has at most one splitter waiting at a time, so this stays
+    # bounded by the width of the manifold
+    arriving_timelines = {}
+    splitters_to_visit = []
+
+    def send_beam(location:Vector, count:int):
+        nonlocal finished_timelines
+        row = next_splitter_row(splitter_rows, location)
+        if row is None:
+            finished_timelines += count
+            return
+
+        splitter = Vector(row, location.j)
+        if splitter not in arriving_timelines:
+            arriving_timelines[splitter] = 0
+            heappush(splitters_to_visit, splitter)
+        arriving_timelines[splitter] += count
+
+    send_beam(start_location, 1)
+    while splitters_to_visit:
+        splitter = heappop(splitters_to_visit)
+        count = arriving_timelines.pop(splitter)
+        split_count += 1
+        send_beam(splitter + WEST, count)
+        send_beam(splitter + EAST, count)
+
+    return split_count, finished_timelines
 
 def solve_part_1(grid:Grid):
-    # Plan: Make all the beams go
-    # Then: Count the splitters that have a beam above them
-
-    start_location = grid.find_one('S')
-    traverse_beam(grid, start_location)
-    print_grid(grid)
-
-    return sum(grid[split + NORTH] == "|" for split in grid.find("^"))
+    split_count, _ = sweep_beams(grid)
+    return split_count
 
 def solve_part_2(grid:Grid):
+    _, timeline_count = sweep_beams(grid)
+    return timeline_count
 
-    @cache
-    def count_possibilities(location:Vector) -> int:
-        next_path = location + SOUTH
-        next_path_content = grid[next_path]
-        if next_path_content in ".|":
-            return count_possibilities(next_path)
-        if next_path_content == "^":
-            count = count_possibilities(next_path + EAST)
-            count += count_possibilities(next_path + WEST)
-            return count
+def solve_part_1_arrays(arrays:dict[str, np.ndarray]):
+    split_count, _ = sweep_beams_numpy(arrays["cells"])
+    return split_count
 
-        return 1
-
-    start_location = grid.find_one("S")
-
-    return count_possibilities(start_location)
+def solve_part_2_arrays(arrays:dict[str, np.ndarray]):
+    _, timeline_count = sweep_beams_numpy(arrays["cells"])
+    return timeline_count
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--example", action="store_true")
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument("-v", "--verbose", action="store_true", help="print debug output while solving")
+    verbosity.add_argument("-q", "--quiet", action="store_true", help="print only the answers")
+    parser.add_argument("--dense", action="store_true", help="store the grid in a DenseGrid")
     args = parser.parse_args()
+    VERBOSE = args.verbose
 
-    puzzle_input = get_puzzle_input(use_example=args.example)
-
-    answer_1 = solve_part_1(puzzle_input)
-    print(f"Part 1: {answer_1}")
+    puzzle_input = get_puzzle_input(use_example=args.example, dense=args.dense)
 
-    answer_2 = solve_part_2(puzzle_input)
-    print(f"Part 2: {answer_2}")
+    answer_1, answer_2 = sweep_beams(puzzle_input)
+    print(answer_1 if args.quiet else f"Part 1: {answer_1}")
+    print(answer_2 if args.quiet else f"Part 2: {answer_2}")
@@ -1,81 +1,184 @@
 import argparse
-from itertools import combinations
-from heapq import nsmallest, nlargest
-from math import sqrt
+from itertools import islice
+import numpy as np
 from rich import print
+from disjoint_set import DisjointSet
+from spatial_index import nearest_pairs
 
 
 EXAMPLE_FILE_NAME = "example.txt"
 INPUT_FILE_NAME= "input.txt"
+VERBOSE = False
+PARSER_VERSION = 1
 
 Point = tuple[int,int,int]
 
-def get_puzzle_input(use_example=False):
-    input_filename = EXAMPLE_FILE_NAME if use_example else INPUT_FILE_NAME
+def get_puzzle_input(use_example=False, input_filename=None):
+    if input_filename is None:
+        input_filename = EXAMPLE_FILE_NAME if use_example else INPUT_FILE_NAME
     puzzle_input = []
     with open(input_filename) as input_txt:
         for line in input_txt:
             puzzle_input.append(tuple(int(x) for x in line.split(",")))
     return puzzle_input
 
-def get_distance(a:Point,b:Point) -> float:
-    return sqrt((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2)
-
-def get_sortable_connection(a:Point, b:Point) -> tuple[float, Point, Point]:
-    return (get_distance(a,b), a, b)
-
+def puzzle_input_to_arrays(puzzle_input) -> dict[str, np.ndarray]:
+    return {"points": np.array(puzzle_input, dtype=np.int64).reshape(-1, 3)}
 
 def solve_part_1(puzzle_input):
-    distance_generator = (get_sortable_connection(a,b) for a,b in combinations(puzzle_input, 2))
-
-
-    clusters = [set((p,)) for p in puzzle_input]
-    for _, a, b in nsmallest(1000, distance_generator):
-        cluster_a = next(filter(lambda c: a in c, clusters))
-        cluster_b = next(filter(lambda c: b in c, clusters))
-        if cluster_a is cluster_b:
-            continue
-
-        cluster_a |= cluster_b
-        clusters.remove(cluster_b)
+    clusters = DisjointSet(len(puzzle_input))
+    for _, i, j in islice(nearest_pairs(puzzle_input), 1000):
+        clusters.union(i, j)
 
     total = 1
-    for cluster_size in nlargest(3, (len(c) for c in clusters)):
+    for cluster_size in clusters.largest_component_sizes(3):
         total *= cluster_size
     return total
 
 
 def solve_part_2(puzzle_input):
-    distance_generator = (get_sortable_connection(a,b) for a,b in combinations(puzzle_input, 2))
-
-    clusters = [set((p,)) for p in puzzle_input]
-    len_clusters = len(clusters)
-    for _, a, b in nsmallest(100000, distance_generator):
-        cluster_a = next(filter(lambda c: a in c, clusters))
-        cluster_b = next(filter(lambda c: b in c, clusters))
-        if cluster_a is cluster_b:
+    clusters = DisjointSet(len(puzzle_input))
+    for _, i, j in nearest_pairs(puzzle_input):
+        if not clusters.union(i, j):
             continue
 
-        cluster_a |= cluster_b
-        clusters.remove(cluster_b)
-        if len(clusters) < len_clusters:
-            print(len_clusters)
-            len_clusters = len(clusters)
+        if VERBOSE:
+            print(clusters.component_count)
 
-        if len(clusters) == 1:
-            return a[0] * b[0]
+        if clusters.component_count == 1:
+            return puzzle_input[i][0] * puzzle_input[j][0]
 
     
 
+def keep_smallest(squared_distance:np.ndarray, i:np.ndarray, j:np.ndarray, k:int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Drop all but the k smallest pairs, ordered by (d^2, i, j) so that ties go
+    the same way they do in nearest_pairs.  argpartition narrows things down
+    to the pairs no further than the kth distance, and only those get sorted.
+    """
+    if len(squared_distance) > k:
+        kth_smallest = squared_distance[np.argpartition(squared_distance, k - 1)[k - 1]]
+        candidates = squared_distance <= kth_smallest
+        squared_distance, i, j = squared_distance[candidates], i[candidates], j[candidates]
+        keep = np.lexsort((j, i, squared_distance))[:k]
+        squared_distance, i, j = squared_distance[keep], i[keep], j[keep]
+    return squared_distance, i, j
+
+def get_closest_connections_numpy(puzzle_input, k:int, block_size:int=1024) -> list[tuple[int, int, int]]:
+    """
+    The k closest pairs as (d^2, i, j) with i < j, closest first and ties in
+    index order, the same as nearest_pairs.  Distances are exact int64 squares
+    worked out on block_size x block_size tiles, so peak memory is set by
+    block_size rather than by the number of points.
+    """
+    points = np.array(puzzle_input, dtype=np.int64).reshape(-1, 3)
+    empty = np.empty(0, dtype=np.int64)
+    closest = (empty, empty, empty)
+    if k <= 0:
+        return []
+
+    for row_start in range(0, len(points), block_size):
+        rows = points[row_start:row_start + block_size]
+        row_ids = np.arange(row_start, row_start + len(rows))
+        for column_start in range(row_start, len(points), block_size):
+            columns = points[column_start:column_start + block_size]
+            column_ids = np.arange(column_start, column_start + len(columns))
+
+            offsets = rows[:, np.newaxis, :] - columns[np.newaxis, :, :]
+            squared_distance = (offsets * offsets).sum(axis=2)
+            i, j = np.broadcast_arrays(row_ids[:, np.newaxis], column_ids[np.newaxis, :])
+            upper_triangle = j > i
+
+            tile = keep_smallest(squared_distance[upper_triangle], i[upper_triangle], j[upper_triangle], k)
+            closest = keep_smallest(*(np.concatenate(pair) for pair in zip(closest, tile)), k)
+
+    squared_distance, i, j = closest
+    order = np.lexsort((j, i, squared_distance))[:k]
+    return list(zip(squared_distance[order].tolist(), i[order].tolist(), j[order].tolist()))
+
+def solve_part_1_numpy(puzzle_input, block_size:int=1024):
+    clusters = DisjointSet(len(puzzle_input))
+    for _, i, j in get_closest_connections_numpy(puzzle_input, 1000, block_size):
+        clusters.union(i, j)
+
+    total = 1
+    for cluster_size in clusters.largest_component_sizes(3):
+        total *= cluster_size
+    return total
+
+def get_longest_spanning_connection(puzzle_input) -> tuple[int, int, int]:
+    """
+    The connection that finally joins everything into one cluster is the
+    longest edge of the minimum spanning tree.  Grow the tree with dense
+    Prim's, which takes O(n^2) time but only O(n) memory, one row of squared
+    distances at a time.  Returns (d^2, i, j) for that edge.
+    """
+    points = np.array(puzzle_input, dtype=np.int64)
+    unreachable = np.iinfo(np.int64).max
+
+    # Squared distance from each point to the tree, and the tree point it's closest to
+    best_squared_distance = np.full(len(points), unreachable, dtype=np.int64)
+    nearest_in_tree = np.zeros(len(points), dtype=np.intp)
+    in_tree = np.zeros(len(points), dtype=bool)
+
+    longest_connection = None
+    v = 0
+    for _ in range(len(points) - 1):
+        in_tree[v] = True
+        best_squared_distance[v] = unreachable
+
+        offsets = points - points[v]
+        squared_distance = (offsets * offsets).sum(axis=1)
+        closer = (squared_distance < best_squared_distance) & ~in_tree
+        best_squared_distance[closer] = squared_distance[closer]
+        nearest_in_tree[closer] = v
+
+        v = int(np.argmin(best_squared_distance))
+        u = int(nearest_in_tree[v])
+        connection = (int(best_squared_distance[v]), min(u, v), max(u, v))
+        if longest_connection is None or connection > longest_connection:
+            longest_connection = connection
+
+    return longest_connection
+
+def solve_part_2_mst(puzzle_input):
+    longest_connection = get_longest_spanning_connection(puzzle_input)
+    if longest_connection is None:
+        return None
+
+    _, i, j = longest_connection
+    return puzzle_input[i][0] * puzzle_input[j][0]
+
+# nearest_pairs reads the points one coordinate at a time, which is much faster
+# from python lists than from numpy scalars, so these take one tolist() of the
+# mapped points rather than working on them in place
+
+def solve_part_1_arrays(arrays:dict[str, np.ndarray]):
+    return solve_part_1(arrays["points"].tolist())
+
+def solve_part_2_arrays(arrays:dict[str, np.ndarray]):
+    return solve_part_2(arrays["points"].tolist())
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--example", action="store_true")
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument("-v", "--verbose", action="store_true", help="print debug output while solving")
+    verbosity.add_argument("-q", "--quiet", action="store_true", help="print only the answers")
+    parser.add_argument("--numpy", action="store_true", help="solve part 1 with the tiled numpy distance kernel")
+    parser.add_argument("--block-size", type=int, default=1024, help="tile size for --numpy")
+    parser.add_argument("--mst", action="store_true", help="solve part 2 with a minimum spanning tree")
     args = parser.parse_args()
+    VERBOSE = args.verbose
 
     puzzle_input = get_puzzle_input(use_example=args.example)
 
-    answer_1 = solve_part_1(puzzle_input)
-    print(f"Part 1: {answer_1}")
+    if args.numpy:
+        answer_1 = solve_part_1_numpy(puzzle_input, args.block_size)
+    else:
+        answer_1 = solve_part_1(puzzle_input)
+    print(answer_1 if args.quiet else f"Part 1: {answer_1}")
 
-    answer_2 = solve_part_2(puzzle_input)
-    print(f"Part 2: {answer_2}")
+    part_2 = solve_part_2_mst if args.mst else solve_part_2
+    answer_2 = part_2(puzzle_input)
+    print(answer_2 if args.quiet else f"Part 2: {answer_2}")
@@ -0,0 +1,56 @@
+"""
+Union-find over the integers 0 to n-1, for tracking which points have been
+connected into the same cluster.
+"""
+
+from heapq import nlargest
+
+
+class DisjointSet:
+    """
+    Disjoint sets with path compression and union by size, so find and union
+    are both effectively constant time.
+    """
+
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.size = [1] * n
+        self.component_count = n
+
+    def find(self, x: int) -> int:
+        root = x
+        while self.parent[root] != root:
+            root = self.parent[root]
+
+        while self.parent[x] != root:
+            self.parent[x], x = root, self.parent[x]
+
+        return root
+
+    def union(self, a: int, b: int) -> bool:
+        """
+        Merge the sets holding a and b.  Returns False if they were already
+        in the same set.
+        """
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return False
+
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        self.component_count -= 1
+        return True
+
+    def component_size(self, x: int) -> int:
+        return self.size[self.find(x)]
+
+    def largest_component_sizes(self, k: int) -> list[int]:
+        """
+        Sizes of the k largest sets, biggest first.  This has to look at every
+        root, so it is linear rather than constant time.
+        """
+        return nlargest(k, (self.size[x] for x, parent in enumerate(self.parent) if x == parent))
@@ -0,0 +1,115 @@
+"""
+A uniform bucket grid over 3D points, for finding close pairs of points without
+measuring the distance between every pair.
+"""
+
+from collections import defaultdict
+from itertools import combinations, product
+from math import isqrt
+from typing import Iterator
+
+Point = tuple[int, int, int]
+
+# How many points to measure nearest neighbor distances for when picking the
+# first search radius
+RADIUS_SAMPLE_SIZE = 16
+
+# Half of the 26 neighboring buckets, so that each pair of buckets is only
+# visited from one side
+FORWARD_NEIGHBOR_OFFSETS = [offset for offset in product((-1, 0, 1), repeat=3) if offset > (0, 0, 0)]
+
+
+def get_squared_distance(a: Point, b: Point) -> int:
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+
+def pairs_within(points: list[Point], max_squared_distance: int, min_squared_distance: int = -1) -> list[tuple[int, int, int]]:
+    """
+    Find every pair of points with min_squared_distance < d^2 <=
+    max_squared_distance, as (d^2, i, j) with i < j indexing into points.
+
+    Points are dropped into cubic buckets at least as wide as the search
+    radius, so a pair can only be within range if its buckets are neighbors.
+    """
+    cell_size = isqrt(max_squared_distance) + 1
+    buckets = defaultdict(list)
+    for index, (x, y, z) in enumerate(points):
+        buckets[(x // cell_size, y // cell_size, z // cell_size)].append(index)
+
+    pairs = []
+    for (bucket_x, bucket_y, bucket_z), members in buckets.items():
+        for i, j in combinations(members, 2):
+            squared_distance = get_squared_distance(points[i], points[j])
+            if min_squared_distance < squared_distance <= max_squared_distance:
+                pairs.append((squared_distance, i, j))
+
+        for offset_x, offset_y, offset_z in FORWARD_NEIGHBOR_OFFSETS:
+            neighbors = buckets.get((bucket_x + offset_x, bucket_y + offset_y, bucket_z + offset_z))
+            if neighbors is None:
+                continue
+
+            for i in members:
+                for j in neighbors:
+                    squared_distance = get_squared_distance(points[i], points[j])
+                    if min_squared_distance < squared_distance <= max_squared_distance:
+                        pairs.append((squared_distance, min(i, j), max(i, j)))
+
+    return pairs
+
+
+def get_nearest_squared_distance(points_by_x: list[Point], index: int) -> int:
+    """
+    Squared distance from one point to its nearest neighbor, given the points
+    sorted by x.  Scans outward from the point in both directions, stopping
+    each way once the gap in x alone is further than the best so far.
+    """
+    x, y, z = points_by_x[index]
+    nearest = None
+    for neighbors in (range(index + 1, len(points_by_x)), range(index - 1, -1, -1)):
+        for j in neighbors:
+            a, b, c = points_by_x[j]
+            if nearest is not None and (x - a) ** 2 >= nearest:
+                break
+            squared_distance = (x - a) ** 2 + (y - b) ** 2 + (z - c) ** 2
+            if nearest is None or squared_distance < nearest:
+                nearest = squared_distance
+    return nearest
+
+
+def get_initial_radius(points: list[Point]) -> int:
+    """
+    The median nearest neighbor distance among a handful of points spread
+    through the list, rounded up.  That's the typical spacing where the points
+    actually are, so clusters and outliers can't blow up the first shell the
+    way a guess from the bounding box can, and the radius only grows from
+    there as more pairs are asked for.
+    """
+    points_by_x = sorted(points)
+    step = max(1, len(points_by_x) // RADIUS_SAMPLE_SIZE)
+    sample = sorted(get_nearest_squared_distance(points_by_x, i) for i in range(0, len(points_by_x), step))
+    return isqrt(max(0, sample[len(sample) // 2] - 1)) + 1
+
+
+def nearest_pairs(points: list[Point]) -> Iterator[tuple[int, int, int]]:
+    """
+    Yield every pair of points in order of increasing distance, as (d^2, i, j)
+    with i < j indexing into points.  Equal distances come out in index order.
+
+    The search works outward in shells, doubling the radius each time, so a
+    caller that only wants the closest few pairs never pays for the rest.
+    """
+    if len(points) < 2:
+        return
+
+    max_squared_distance = sum((max(p[axis] for p in points) - min(p[axis] for p in points)) ** 2 for axis in range(3))
+
+    radius = get_initial_radius(points)
+    searched_squared_distance = -1
+    while searched_squared_distance < max_squared_distance:
+        shell_squared_distance = min(radius ** 2, max_squared_distance)
+        shell = pairs_within(points, shell_squared_distance, searched_squared_distance)
+        shell.sort()
+        yield from shell
+
+        searched_squared_distance = shell_squared_distance
+        radius *= 2
@@ -0,0 +1,206 @@
+"""
+Advent of Code Benchmarks
+
+Times each day's parse step and both parts over repeated runs, and compares
+the medians against a stored baseline.  Exits non-zero if anything got slower
+than the baseline by more than the threshold.
+
+Works offline against the checked-in input.txt, plus example.txt for any day
+that has one.
+
+Usage:
+    python bench.py [day ...] [--repeat N] [--threshold FRACTION] [--record]
+
+Examples:
+    python bench.py                   # Compare every day against the baseline
+    python bench.py 4 7 --repeat 10   # Just days 4 and 7, with more runs
+    python bench.py --record          # Write a new baseline
+"""
+
+import argparse
+import json
+import statistics
+import sys
+from pathlib import Path
+from typing import Optional
+
+from rich import print
+from rich.table import Table
+
+from run import EXAMPLE_FILE_NAME, INPUT_FILE_NAME, discover_days, load_day_module, run_day
+
+
+BASELINE_FILE_NAME = "benchmarks.json"
+STEPS = ["parse", "part_1", "part_2"]
+
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_NOISE_FLOOR = 0.001
+
+
+# Measuring
+
+def summarize(times: list[float]) -> dict[str, float]:
+    """Median and spread, in seconds, of a list of timings."""
+    return {
+        "median": statistics.median(times),
+        "min": min(times),
+        "max": max(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+    }
+
+
+def benchmark_input(day: str, solution_path: Path, input_path: Path, repeat: int) -> dict[str, dict[str, float]]:
+    """
+    Time a day against one input file.  Every run parses the input afresh,
+    since some solutions change their puzzle input as they go.
+
+    Args:
+        day: Zero-padded day number
+        solution_path: Path to the day's solution script
+        input_path: Input file to parse
+        repeat: Number of runs
+
+    Returns:
+        Summary of the timings for each step
+    """
+    module = load_day_module(day, solution_path)
+    times = {step: [] for step in STEPS}
+    for _ in range(repeat):
+        result = run_day(day, module, input_path)
+        times["parse"].append(result.parse_time)
+        times["part_1"].append(result.part_1_time)
+        times["part_2"].append(result.part_2_time)
+
+    return {step: summarize(step_times) for step, step_times in times.items()}
+
+
+def run_benchmarks(root: Path, days: Optional[list[str]] = None, repeat: int = DEFAULT_REPEAT) -> dict[str, dict]:
+    """
+    Benchmark every day against every input file it has.
+
+    Args:
+        root: Repository root
+        days: Zero-padded days to run, or None for all of them
+        repeat: Number of runs per input
+
+    Returns:
+        Mapping of "day/input file" to its step summaries
+    """
+    benchmarks = {}
+    for day, solution_path in discover_days(root).items():
+        if days is not None and day not in days:
+            continue
+
+        for input_file_name in (INPUT_FILE_NAME, EXAMPLE_FILE_NAME):
+            input_path = solution_path.parent / input_file_name
+            if input_path.exists():
+                print(f"Benchmarking {day}/{input_file_name}...", file=sys.stderr)
+                benchmarks[f"{day}/{input_file_name}"] = benchmark_input(day, solution_path, input_path, repeat)
+
+    return benchmarks
+
+
+# Comparing
+
+def find_regressions(
+    benchmarks: dict[str, dict],
+    baseline: dict[str, dict],
+    threshold: float = DEFAULT_THRESHOLD,
+    noise_floor: float = DEFAULT_NOISE_FLOOR,
+) -> list[tuple[str, str]]:
+    """
+    Find the steps whose median is more than threshold (as a fraction) slower
+    than the baseline median.  Slowdowns smaller than noise_floor seconds are
+    ignored, since steps that only take a few microseconds jitter a lot.
+
+    Returns:
+        (benchmark name, step) for each regression
+    """
+    regressions = []
+    for name, steps in benchmarks.items():
+        for step, summary in steps.items():
+            baseline_summary = baseline.get(name, {}).get(step)
+            if baseline_summary is None:
+                continue
+
+            slowdown = summary["median"] - baseline_summary["median"]
+            if slowdown > noise_floor and slowdown > baseline_summary["median"] * threshold:
+                regressions.append((name, step))
+
+    return regressions
+
+
+def format_summary(summary: Optional[dict[str, float]]) -> str:
+    if summary is None:
+        return "-"
+    return f"{summary['median'] * 1000:.2f} ms ± {summary['stdev'] * 1000:.2f}"
+
+
+def build_comparison_table(benchmarks: dict[str, dict], baseline: dict[str, dict], regressions: list[tuple[str, str]]) -> Table:
+    """Lay the medians out next to the baseline, with regressions in red."""
+    table = Table(title="Benchmarks")
+    table.add_column("Input")
+    table.add_column("Step")
+    table.add_column("Median", justify="right")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Change", justify="right")
+
+    for name, steps in benchmarks.items():
+        for step, summary in steps.items():
+            baseline_summary = baseline.get(name, {}).get(step)
+            change = "-"
+            if baseline_summary is not None and baseline_summary["median"] > 0:
+                change = f"{summary['median'] / baseline_summary['median'] - 1:+.0%}"
+
+            style = "red" if (name, step) in regressions else None
+            table.add_row(name, step, format_summary(summary), format_summary(baseline_summary), change, style=style)
+
+    return table
+
+
+def main() -> None:
+    """
+    Main entry point for the script.
+
+    Runs the benchmarks, then either records them as the new baseline or
+    compares them against the existing one.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark Advent of Code solutions against a stored baseline")
+    parser.add_argument("days", nargs="*", help="days to run, default all")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="runs per input")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed slowdown as a fraction of the baseline")
+    parser.add_argument("--noise-floor", type=float, default=DEFAULT_NOISE_FLOOR, help="slowdowns under this many seconds are ignored")
+    parser.add_argument("--baseline", type=Path, default=Path(__file__).parent / BASELINE_FILE_NAME, help="baseline JSON file")
+    parser.add_argument("--record", action="store_true", help="write the results as the new baseline")
+    args = parser.parse_args()
+
+    try:
+        days = [f"{int(day):02d}" for day in args.days] or None
+    except ValueError:
+        print(f"Error: days must be integers, got {args.days}", file=sys.stderr)
+        sys.exit(1)
+
+    benchmarks = run_benchmarks(Path(__file__).parent, days, args.repeat)
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+
+    if args.record:
+        # Keep the baseline for any days that weren't run this time
+        baseline.update(benchmarks)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"✓ Recorded {len(benchmarks)} benchmarks to {args.baseline}")
+        return
+
+    regressions = find_regressions(benchmarks, baseline, args.threshold, args.noise_floor)
+    print(build_comparison_table(benchmarks, baseline, regressions))
+
+    if regressions:
+        print(f"✗ {len(regressions)} step(s) slower than the baseline by more than {args.threshold:.0%}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
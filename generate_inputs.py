@@ -0,0 +1,210 @@
+"""
+Advent of Code Synthetic Inputs
+
+Generates puzzle inputs of any size, in the same format as each day's real
+input.txt, for seeing how the solutions scale.  Scale 1 is roughly the size of
+the real input, and the same seed and scale always give the same file.
+
+Usage:
+    python generate_inputs.py [day ...] [--scale N] [--seed N] [--name FILE]
+
+Examples:
+    python generate_inputs.py --scale 100        # Writes NN/synthetic.txt for every day
+    python generate_inputs.py 8 --scale 1000 --seed 2
+    python run.py --input-name synthetic.txt     # Then time the solutions on them
+"""
+
+import argparse
+import math
+import random
+import sys
+from pathlib import Path
+from typing import Callable
+
+from rich import print
+
+
+DEFAULT_FILE_NAME = "synthetic.txt"
+
+
+# Generators
+#
+# Each takes a seeded Random and a scale factor and returns the whole file
+
+def generate_day_01(rng: random.Random, scale: float) -> str:
+    """Dial rotations, one per line: R or L and an amount, mostly under 100."""
+    lines = []
+    for _ in range(max(1, round(4400 * scale))):
+        amount = rng.randint(1, 99) if rng.random() < 0.8 else rng.randint(100, 999)
+        lines.append(f"{rng.choice('RL')}{amount}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_02(rng: random.Random, scale: float) -> str:
+    """Disjoint product id ranges on one comma separated line."""
+    lows = sorted(round(10 ** rng.uniform(1, 10)) for _ in range(max(1, round(30 * scale))))
+    ranges = []
+    previous_high = 0
+    for low in lows:
+        low = max(low, previous_high + 2)
+        high = low + round(10 ** rng.uniform(1, 5.5))
+        ranges.append(f"{low}-{high}")
+        previous_high = high
+    rng.shuffle(ranges)
+    return ",".join(ranges) + "\n"
+
+
+def generate_day_03(rng: random.Random, scale: float) -> str:
+    """Battery banks, one line of 100 digits each."""
+    lines = ["".join(rng.choices("123456789", k=100)) for _ in range(max(1, round(200 * scale)))]
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_04(rng: random.Random, scale: float) -> str:
+    """A square grid of rolls (@) and floor (.), growing in area with scale."""
+    side = max(1, round(137 * math.sqrt(scale)))
+    lines = ["".join("@" if rng.random() < 0.64 else "." for _ in range(side)) for _ in range(side)]
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_05(rng: random.Random, scale: float) -> str:
+    """Overlapping fresh id ranges, a blank line, then ingredient ids."""
+    ranges = []
+    for _ in range(max(1, round(177 * scale))):
+        low = rng.randint(10 ** 12, 56 * 10 ** 13)
+        ranges.append(f"{low}-{low + round(10 ** rng.uniform(10, 12.7))}")
+
+    items = [str(rng.randint(10 ** 12, 57 * 10 ** 13)) for _ in range(max(1, round(1000 * scale)))]
+    return "\n".join(ranges) + "\n\n" + "\n".join(items) + "\n"
+
+
+def reads_contiguously(lengths: list[int]) -> bool:
+    """
+    Whether a problem's digit columns each read as one unbroken run, top to
+    bottom, whichever way its numbers are aligned.  That holds as long as the
+    lengths rise and then fall, and never dip and rise again.
+    """
+    peak = lengths.index(max(lengths))
+    rising = all(a <= b for a, b in zip(lengths[:peak], lengths[1:peak + 1]))
+    falling = all(a >= b for a, b in zip(lengths[peak:], lengths[peak + 1:]))
+    return rising and falling
+
+
+def generate_day_06(rng: random.Random, scale: float) -> str:
+    """
+    A worksheet of problems side by side: four rows of operands and a row of
+    operators.  Each problem is as wide as its longest number, its numbers
+    are all aligned left or all aligned right, and a blank column separates
+    it from the next.  Like the real worksheets, no digit column has a gap
+    in it.
+    """
+    rows = [[] for _ in range(5)]
+    for _ in range(max(1, round(1000 * scale))):
+        lengths = [rng.randint(1, 4) for _ in range(4)]
+        while not reads_contiguously(lengths):
+            lengths = [rng.randint(1, 4) for _ in range(4)]
+        numbers = [str(rng.randint(10 ** (digits - 1), 10 ** digits - 1)) for digits in lengths]
+        width = max(len(number) for number in numbers)
+        align = str.ljust if rng.random() < 0.5 else str.rjust
+        for row, number in zip(rows, numbers):
+            row.append(align(number, width))
+        rows[4].append(rng.choice("+*").ljust(width))
+    return "\n".join(" ".join(row) for row in rows) + "\n"
+
+
+def generate_day_07(rng: random.Random, scale: float) -> str:
+    """
+    A tachyon manifold: S at the top middle, and splitters on every other row
+    where a beam could reach them, spreading out by a column each row until
+    they fill the width.  Taller with scale.
+    """
+    width = 141
+    height = max(3, round(142 * scale))
+    center = width // 2
+
+    lines = ["." * center + "S" + "." * (width - center - 1)]
+    for i in range(1, height):
+        row = ["."] * width
+        if i % 2 == 0:
+            spread = i // 2 - 1
+            for j in range(center - spread, center + spread + 1, 2):
+                if 0 <= j < width and rng.random() < 0.7:
+                    row[j] = "^"
+            # Past the edges, keep going on the columns with the same parity
+            for j in range((center - spread) % 2, width, 2):
+                if abs(j - center) > spread and rng.random() < 0.7:
+                    row[j] = "^"
+        lines.append("".join(row))
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_08(rng: random.Random, scale: float) -> str:
+    """Junction box positions, one x,y,z per line."""
+    lines = [
+        f"{rng.randint(0, 99999)},{rng.randint(0, 99999)},{rng.randint(0, 99999)}"
+        for _ in range(max(2, round(1000 * scale)))
+    ]
+    return "\n".join(lines) + "\n"
+
+
+GENERATORS: dict[int, Callable[[random.Random, float], str]] = {
+    1: generate_day_01,
+    2: generate_day_02,
+    3: generate_day_03,
+    4: generate_day_04,
+    5: generate_day_05,
+    6: generate_day_06,
+    7: generate_day_07,
+    8: generate_day_08,
+}
+
+
+def generate_input(day: int, scale: float = 1.0, seed: int = 0) -> str:
+    """
+    Generate an input for a day.
+
+    Args:
+        day: Day number
+        scale: Size relative to the real input
+        seed: Random seed
+
+    Returns:
+        str: The contents of the input file
+
+    Raises:
+        ValueError: If there is no generator for the day
+    """
+    if day not in GENERATORS:
+        raise ValueError(f"No generator for day {day}. Days with generators: {sorted(GENERATORS)}")
+    return GENERATORS[day](random.Random(f"{day}:{seed}"), scale)
+
+
+def main() -> None:
+    """
+    Main entry point for the script.
+
+    Parses command-line arguments and writes a synthetic input into each
+    requested day's directory.
+    """
+    parser = argparse.ArgumentParser(description="Generate synthetic Advent of Code inputs")
+    parser.add_argument("days", nargs="*", type=int, help="days to generate, default all")
+    parser.add_argument("--scale", type=float, default=1.0, help="size relative to the real input")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--name", default=DEFAULT_FILE_NAME, help="file name to write in each day's directory")
+    args = parser.parse_args()
+
+    root = Path(__file__).parent
+    for day in args.days or sorted(GENERATORS):
+        try:
+            content = generate_input(day, args.scale, args.seed)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        output_path = root / f"{day:02d}" / args.name
+        output_path.write_text(content)
+        print(f"✓ Wrote {output_path.relative_to(root)} ({len(content)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
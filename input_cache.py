@@ -0,0 +1,110 @@
+"""
+Advent of Code Input Cache
+
+Keeps parsed puzzle inputs as .npy files, keyed on a hash of the input file
+and the day's parser version, so later runs memory-map them instead of parsing
+the text again.  The mapped arrays go straight to solvers that work on
+arrays, rather than being rebuilt into the parser's python objects.
+
+A day opts in by defining:
+    PARSER_VERSION                  Bump it whenever the arrays change
+    puzzle_input_to_arrays(input)   The parsed input as named numpy arrays
+    solve_part_1_arrays(arrays)     Each part solved from those arrays, which
+    solve_part_2_arrays(arrays)     are memory-mapped read-only
+
+Days without them are parsed and solved as usual.  Cached inputs live under
+.input_cache/<module>/<sha256>-v<version>/, and deleting that directory is
+always safe.
+
+Usage:
+    python run.py --cache
+"""
+
+import hashlib
+import shutil
+import tempfile
+from pathlib import Path
+from types import ModuleType
+
+import numpy as np
+
+
+CACHE_DIRECTORY_NAME = ".input_cache"
+HASH_BLOCK_SIZE = 1 << 20
+
+
+# Keys
+
+def is_cacheable(module: ModuleType) -> bool:
+    """Whether a day's module has the hooks the cache needs."""
+    return all(
+        hasattr(module, name)
+        for name in ("PARSER_VERSION", "puzzle_input_to_arrays", "solve_part_1_arrays", "solve_part_2_arrays")
+    )
+
+
+def hash_file(path: Path) -> str:
+    """sha256 of a file's contents, as hex."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as input_file:
+        while block := input_file.read(HASH_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def get_cache_path(cache_root: Path, module: ModuleType, input_path: Path) -> Path:
+    """
+    Directory holding the cached arrays for one input.  Editing the input
+    or bumping the parser version gives a new directory, so stale entries
+    are never read, just left behind.
+    """
+    return cache_root / module.__name__ / f"{hash_file(input_path)}-v{module.PARSER_VERSION}"
+
+
+# Reading and Writing
+
+def save_arrays(cache_path: Path, arrays: dict[str, np.ndarray]) -> None:
+    """
+    Write each array to cache_path as <name>.npy.  The files are written to
+    a scratch directory first and moved into place in one go, so a reader
+    never sees a half written entry.
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    scratch_path = Path(tempfile.mkdtemp(dir=cache_path.parent))
+    try:
+        for name, array in arrays.items():
+            np.save(scratch_path / f"{name}.npy", np.asarray(array), allow_pickle=False)
+        scratch_path.rename(cache_path)
+    except OSError:
+        # Most likely another run got there first, in which case its entry
+        # is as good as ours
+        if not cache_path.is_dir():
+            raise
+    finally:
+        shutil.rmtree(scratch_path, ignore_errors=True)
+
+
+def load_arrays(cache_path: Path) -> dict[str, np.ndarray]:
+    """Memory-map every array in cache_path, read-only."""
+    return {path.stem: np.load(path, mmap_mode="r", allow_pickle=False) for path in cache_path.glob("*.npy")}
+
+
+def get_puzzle_arrays(module: ModuleType, input_path: Path, cache_root: Path) -> dict[str, np.ndarray]:
+    """
+    A day's parsed puzzle input as memory-mapped arrays.  On a miss the input
+    is parsed as usual and stored first, so the day is solved the same way
+    whether or not the cache was warm.
+
+    Args:
+        module: The day's solution module, which must be cacheable
+        input_path: Input file to parse
+        cache_root: Directory holding the cache
+
+    Returns:
+        Mapping of array name to read-only array
+    """
+    cache_path = get_cache_path(cache_root, module, input_path)
+    if not cache_path.is_dir():
+        puzzle_input = module.get_puzzle_input(input_filename=str(input_path))
+        save_arrays(cache_path, module.puzzle_input_to_arrays(puzzle_input))
+    return load_arrays(cache_path)
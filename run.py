@@ -0,0 +1,260 @@
+"""
+Advent of Code Runner
+
+Runs every day's solution in a single process and reports how long parsing
+and each part took, in one table.
+
+Usage:
+    python run.py [day ...] [--example | --input-name FILE] [--cache]
+
+Examples:
+    python run.py
+    python run.py 4 7
+    python run.py --example
+    python run.py --input-name synthetic.txt
+    python run.py --cache     # Reuse parsed inputs from earlier runs
+"""
+
+import argparse
+import importlib.util
+import re
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, NamedTuple, Optional
+
+from rich import print
+from rich.table import Table
+
+import input_cache
+
+
+EXAMPLE_FILE_NAME = "example.txt"
+INPUT_FILE_NAME = "input.txt"
+
+DAY_DIRECTORY_PATTERN = re.compile(r"^\d\d$")
+
+
+class DayResult(NamedTuple):
+    """Answers and timings, in seconds, for one day."""
+    day: str
+    parse_time: float
+    answer_1: Any
+    part_1_time: float
+    answer_2: Any
+    part_2_time: float
+
+
+# Discovery and Loading
+
+def discover_days(root: Path) -> dict[str, Path]:
+    """
+    Find the day solutions under root.
+
+    Args:
+        root: Repository root, holding one directory per day ("01", "02", ...)
+
+    Returns:
+        Mapping of zero-padded day to the path of its solution script, in day
+        order
+    """
+    days = {}
+    for day_dir in sorted(root.iterdir()):
+        solution_path = day_dir / f"{day_dir.name}.py"
+        if DAY_DIRECTORY_PATTERN.match(day_dir.name) and solution_path.is_file():
+            days[day_dir.name] = solution_path
+    return days
+
+
+def load_day_module(day: str, solution_path: Path) -> ModuleType:
+    """
+    Import a day's solution script as the module "day{day}".
+
+    Day scripts import their helpers (grid, intervals, ...) as top-level
+    modules from their own directory, and two days can have helpers with the
+    same name.  So the day's directory is only on sys.path while it's being
+    imported, and any helpers it pulled in are dropped from sys.modules
+    afterwards so the next day gets its own.
+
+    Args:
+        day: Zero-padded day number
+        solution_path: Path to the day's solution script
+
+    Returns:
+        The imported module
+    """
+    module_name = f"day{day}"
+    day_dir = solution_path.parent.resolve()
+    modules_before = set(sys.modules)
+
+    spec = importlib.util.spec_from_file_location(module_name, solution_path)
+    module = importlib.util.module_from_spec(spec)
+    # Registered so that anything the day hands to worker processes can be
+    # pickled by reference
+    sys.modules[module_name] = module
+
+    sys.path.insert(0, str(day_dir))
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(str(day_dir))
+        for name in set(sys.modules) - modules_before - {module_name}:
+            module_file = getattr(sys.modules[name], "__file__", None)
+            # Compare directories rather than files, since a helper can be a
+            # symlink to another day's copy (07/grid.py -> 04/grid.py)
+            if module_file is not None and Path(module_file).parent.resolve() == day_dir:
+                del sys.modules[name]
+
+    return module
+
+
+# Running
+
+def time_call(function: Callable, *args, **kwargs) -> tuple[Any, float]:
+    """Call function, returning its result and how long it took in seconds."""
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def run_day(day: str, module: ModuleType, input_path: Path, cache_root: Optional[Path] = None) -> DayResult:
+    """
+    Parse a day's input and solve both parts, timing each step.
+
+    Args:
+        day: Zero-padded day number
+        module: The day's solution module
+        input_path: Input file to parse
+        cache_root: Input cache directory, or None to always parse afresh.
+            Days that support the cache are then solved from its arrays
+
+    Returns:
+        DayResult with the answers and timings
+    """
+    if cache_root is not None and input_cache.is_cacheable(module):
+        # Solved straight from the memory-mapped arrays
+        arrays, parse_time = time_call(input_cache.get_puzzle_arrays, module, input_path, cache_root)
+        solve_args = (arrays,)
+        solve_part_1, solve_part_2 = module.solve_part_1_arrays, module.solve_part_2_arrays
+    else:
+        puzzle_input, parse_time = time_call(module.get_puzzle_input, input_filename=str(input_path))
+        # Days whose parser returns several values (like day 05's ranges and
+        # items) take them as separate arguments
+        solve_args = puzzle_input if isinstance(puzzle_input, tuple) else (puzzle_input,)
+        solve_part_1, solve_part_2 = module.solve_part_1, module.solve_part_2
+
+    answer_1, part_1_time = time_call(solve_part_1, *solve_args)
+    answer_2, part_2_time = time_call(solve_part_2, *solve_args)
+
+    return DayResult(day, parse_time, answer_1, part_1_time, answer_2, part_2_time)
+
+
+def format_seconds(seconds: float) -> str:
+    return f"{seconds * 1000:.1f} ms"
+
+
+def build_results_table(results: list[DayResult]) -> Table:
+    """Lay the results out as a rich table, with a total row at the bottom."""
+    table = Table(title="Advent of Code 2025")
+    table.add_column("Day")
+    table.add_column("Parse", justify="right")
+    table.add_column("Part 1", justify="right")
+    table.add_column("Answer 1", justify="right", overflow="fold")
+    table.add_column("Part 2", justify="right")
+    table.add_column("Answer 2", justify="right", overflow="fold")
+    table.add_column("Total", justify="right")
+
+    for result in results:
+        table.add_row(
+            result.day,
+            format_seconds(result.parse_time),
+            format_seconds(result.part_1_time),
+            str(result.answer_1),
+            format_seconds(result.part_2_time),
+            str(result.answer_2),
+            format_seconds(result.parse_time + result.part_1_time + result.part_2_time),
+        )
+
+    parse_total = sum(r.parse_time for r in results)
+    part_1_total = sum(r.part_1_time for r in results)
+    part_2_total = sum(r.part_2_time for r in results)
+    table.add_section()
+    table.add_row(
+        "All",
+        format_seconds(parse_total),
+        format_seconds(part_1_total),
+        "",
+        format_seconds(part_2_total),
+        "",
+        format_seconds(parse_total + part_1_total + part_2_total),
+    )
+    return table
+
+
+def run_days(
+    root: Path,
+    days: Optional[list[str]] = None,
+    input_file_name: str = INPUT_FILE_NAME,
+    cache_root: Optional[Path] = None,
+) -> list[DayResult]:
+    """
+    Load and run each day, skipping any without the input file.
+
+    Args:
+        root: Repository root
+        days: Zero-padded days to run, or None for all of them
+        input_file_name: Input file to read from each day's directory
+        cache_root: Input cache directory, or None to always parse afresh
+
+    Returns:
+        A DayResult for each day that ran, in day order
+    """
+    solutions = discover_days(root)
+
+    results = []
+    for day, solution_path in solutions.items():
+        if days is not None and day not in days:
+            continue
+
+        input_path = solution_path.parent / input_file_name
+        if not input_path.exists():
+            print(f"⚠ Skipping day {day} (no {input_file_name})", file=sys.stderr)
+            continue
+
+        module = load_day_module(day, solution_path)
+        results.append(run_day(day, module, input_path, cache_root))
+
+    return results
+
+
+def main() -> None:
+    """
+    Main entry point for the script.
+
+    Parses command-line arguments, runs the requested days and prints the
+    timing table.
+    """
+    parser = argparse.ArgumentParser(description="Run Advent of Code solutions and time them")
+    parser.add_argument("days", nargs="*", help="days to run, default all")
+    input_file = parser.add_mutually_exclusive_group()
+    input_file.add_argument("--example", action="store_true", help="use example.txt instead of input.txt")
+    input_file.add_argument("--input-name", help="use this file from each day's directory instead of input.txt")
+    parser.add_argument("--cache", action="store_true", help=f"reuse parsed inputs stored in {input_cache.CACHE_DIRECTORY_NAME}")
+    args = parser.parse_args()
+
+    try:
+        days = [f"{int(day):02d}" for day in args.days] or None
+    except ValueError:
+        print(f"Error: days must be integers, got {args.days}", file=sys.stderr)
+        sys.exit(1)
+
+    input_file_name = args.input_name or (EXAMPLE_FILE_NAME if args.example else INPUT_FILE_NAME)
+    root = Path(__file__).parent
+    cache_root = root / input_cache.CACHE_DIRECTORY_NAME if args.cache else None
+    results = run_days(root, days, input_file_name, cache_root)
+    print(build_results_table(results))
+
+
+if __name__ == "__main__":
+    main()
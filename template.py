@@ -3,9 +3,11 @@ from rich import print
 
 EXAMPLE_FILE_NAME = "example.txt"
 INPUT_FILE_NAME= "input.txt"
+VERBOSE = False
 
-def get_puzzle_input(use_example=False):
-    input_filename = EXAMPLE_FILE_NAME if use_example else INPUT_FILE_NAME
+def get_puzzle_input(use_example=False, input_filename=None):
+    if input_filename is None:
+        input_filename = EXAMPLE_FILE_NAME if use_example else INPUT_FILE_NAME
     puzzle_input = []
     with open(input_filename) as input_txt:
         for line in input_txt:
@@ -21,12 +23,16 @@ def solve_part_2(puzzle_input):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--example", action="store_true")
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument("-v", "--verbose", action="store_true", help="print debug output while solving")
+    verbosity.add_argument("-q", "--quiet", action="store_true", help="print only the answers")
     args = parser.parse_args()
+    VERBOSE = args.verbose
 
     puzzle_input = get_puzzle_input(use_example=args.example)
 
     answer_1 = solve_part_1(puzzle_input)
-    print(f"Part 1: {answer_1}")
+    print(answer_1 if args.quiet else f"Part 1: {answer_1}")
 
     answer_2 = solve_part_2(puzzle_input)
-    print(f"Part 2: {answer_2}")
+    print(answer_2 if args.quiet else f"Part 2: {answer_2}")